@@ -9,6 +9,7 @@ from django.template.loader import select_template
 
 from .conf import load_settings
 from .exceptions import BuildError, RenderError
+from .routes import make_route_dir_tree
 
 
 def make_client_bundle(
@@ -97,8 +98,6 @@ def make_bundle(
     Returns the build path of the bundle.
 
     """
-    from .routes import make_route_dir_tree  # noqa: avoid circular import
-
     debug = settings.DEBUG
 
     if env is None:
@@ -141,8 +140,7 @@ def make_bundle(
         content = template.render(context, request)
         template_path = Path(template.origin.name)
         build_path = build_dir / template_path.name
-        with build_path.open("w") as fp:
-            fp.write(content)
+        _write_if_changed(build_path, content)
 
     # Create bundle from entrypoint ------------------------------------
 
@@ -187,6 +185,18 @@ def make_bundle(
     return bundle_path
 
 
+def _write_if_changed(path: Path, content: str) -> None:
+    """Write content to path unless the file already has that content.
+
+    Leaving unchanged files alone keeps their mtimes stable so watchers
+    and esbuild don't see spurious changes.
+
+    """
+    if path.is_file() and path.read_text() == content:
+        return
+    path.write_text(content)
+
+
 def get_template(name, extensions=("tsx", "jsx")):
     candidates = [f"{name}.{ext}" for ext in extensions]
     return select_template(candidates)
@@ -1,12 +1,27 @@
 import os
+from copy import deepcopy
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, Tuple
 
 import toml
 from django.core.exceptions import ImproperlyConfigured
 
 from .utils import merge_dicts
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None  # type: ignore[assignment]
+
+# Characters a TOML value can start with. Env values that don't start
+# with one of these can't be parsed as TOML and are used as is.
+_TOML_VALUE_START_CHARS = frozenset("\"'[{+-0123456789tfin")
+
+# Parsed settings files keyed by path. Each entry holds the file's
+# mtime along with the parsed data and is replaced when the mtime
+# changes.
+_toml_cache: Dict[str, Tuple[int, dict]] = {}
+
 
 def get_settings_file(*, path=None, env=None):
     """Figure out which settings file to use.
@@ -43,12 +58,39 @@ def load_settings(*, path=None, env=None):
     public_path = env_path.parent / "settings.public.toml"
     toml_settings = []
     for settings_file_path in (public_path, env_path):
-        if settings_file_path.is_file():
-            with settings_file_path.open() as fp:
-                toml_settings.append(toml.load(fp))
+        try:
+            toml_settings.append(load_toml(settings_file_path))
+        except FileNotFoundError:
+            pass
     return merge_dicts(*toml_settings)
 
 
+def load_toml(path: Path) -> dict:
+    """Load TOML file, reusing the parsed result if it hasn't changed.
+
+    Parsed files are cached by path and reparsed when their modification
+    time changes. A copy is returned so callers are free to modify the
+    result.
+
+    Raises `FileNotFoundError` if the file doesn't exist.
+
+    """
+    key = os.fspath(path)
+    mtime = os.stat(key).st_mtime_ns
+    entry = _toml_cache.get(key)
+    if entry is not None and entry[0] == mtime:
+        data = entry[1]
+    else:
+        if tomllib is not None:
+            with open(key, "rb") as fp:
+                data = tomllib.load(fp)
+        else:
+            with open(key) as fp:
+                data = toml.load(fp)
+        _toml_cache[key] = (mtime, data)
+    return deepcopy(data)
+
+
 def getenv(name: str, default=None, required=False) -> Any:
     """Get setting from environment variable or return `default`.
 
@@ -61,6 +103,8 @@ def getenv(name: str, default=None, required=False) -> Any:
     env_val = os.getenv(name, default)
     if env_val is None:
         return None
+    if isinstance(env_val, str) and env_val.lstrip()[:1] not in _TOML_VALUE_START_CHARS:
+        return env_val
     try:
         obj = toml.loads(f"{name} = {env_val}\n")
     except ValueError:
@@ -1,4 +1,4 @@
-from functools import update_wrapper
+from functools import partial, update_wrapper
 from typing import Callable, Optional, Sequence
 
 from .views.handler import Handler, Impl
@@ -40,25 +40,42 @@ def handler(
 
     """
 
-    def wrapper(impl: Impl) -> Handler:
-        nonlocal path
+    return partial(
+        _make_handler,
+        method,
+        path,
+        loader,
+        cache_time,
+        private,
+        vary_on,
+        cache_control,
+    )
 
-        # NOTE: The order of these two lines matters
-        path = path or impl.__name__.replace("_", "-")
-        path = "" if path == method else path
 
-        return update_wrapper(
-            Handler(
-                impl,
-                method,
-                path=path,
-                is_loader=loader,
-                cache_time=cache_time,
-                private=private,
-                vary_on=vary_on,
-                cache_control=cache_control,
-            ),
-            impl,
-        )
+def _make_handler(
+    method: str,
+    path: str,
+    loader: bool,
+    cache_time: Optional[int],
+    private: Optional[bool],
+    vary_on: Optional[Sequence[str]],
+    cache_control: Optional[dict],
+    impl: Impl,
+) -> Handler:
+    # NOTE: The order of these two lines matters
+    path = path or impl.__name__.replace("_", "-")
+    path = "" if path == method else path
 
-    return wrapper
+    return update_wrapper(
+        Handler(
+            impl,
+            method,
+            path=path,
+            is_loader=loader,
+            cache_time=cache_time,
+            private=private,
+            vary_on=vary_on,
+            cache_control=cache_control,
+        ),
+        impl,
+    )
@@ -1,4 +1,5 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
 from socket import gethostname
@@ -7,6 +8,8 @@ from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 from django.core.exceptions import ImproperlyConfigured
 from django.utils.module_loading import import_string
 
+DEFAULT_WEBMASTER = f"webmaster@{gethostname()}"
+
 
 @dataclass
 class DjangoKitSettings:
@@ -94,7 +97,7 @@ class DjangoKitSettings:
     ssr: bool = True
     """Whether SSR is enabled."""
 
-    webmaster: str = field(default_factory=lambda: f"webmaster@{gethostname()}")
+    webmaster: str = DEFAULT_WEBMASTER
     """Email address of the webmaster / site admin."""
 
     noscript_message: str = (
@@ -106,35 +109,42 @@ class DjangoKitSettings:
     
     """
 
+    def __post_init__(self):
+        # Checks are deferred until all fields have been set.
+        object.__setattr__(self, "_initialized", True)
+        self.check()
+
+    def _set_package(self, package):
+        package_dir = get_package_dir(package)
+        self.package_dir = package_dir
+        self.app_dir = package_dir / "app"
+        self.models_dir = package_dir / "models"
+        self.routes_dir = package_dir / "routes"
+        self.routes_package = f"{package}.routes"
+        self.static_dir = package_dir / "static"
+
+    def _set_route_view_class(self, view_class):
+        if isinstance(view_class, str):
+            self.route_view_class = import_string(view_class)
+
+    def _set_current_user_serializer(self, serializer):
+        if isinstance(serializer, str):
+            self.current_user_serializer = import_string(serializer)
+
+    # Setting name => hook called after the setting is set.
+    _setattr_hooks = {
+        "package": _set_package,
+        "route_view_class": _set_route_view_class,
+        "current_user_serializer": _set_current_user_serializer,
+    }
+
     def __setattr__(self, name, value):
         super().__setattr__(name, value)
-        if name == "package":
-            package = value
-            module = import_module(package)
-            paths = module.__path__
-            if len(paths) > 1:
-                raise ImproperlyConfigured(
-                    f"DjangoKit app package {package} appears to be a "
-                    "namespace package because it resolves to multiple "
-                    "file system paths. You might need to add an "
-                    "__init__.py to the package."
-                )
-            package_dir = Path(paths[0])
-            self.package_dir = package_dir
-            self.app_dir = package_dir / "app"
-            self.models_dir = package_dir / "models"
-            self.routes_dir = package_dir / "routes"
-            self.routes_package = f"{package}.routes"
-            self.static_dir = package_dir / "static"
-        elif name == "route_view_class":
-            view_class = value
-            if isinstance(view_class, str):
-                self.route_view_class = import_string(value)
-        elif name == "current_user_serializer":
-            serializer = value
-            if isinstance(serializer, str):
-                self.current_user_serializer = import_string(serializer)
-        self.check()
+        hook = self._setattr_hooks.get(name)
+        if hook is not None:
+            hook(self, value)
+        if getattr(self, "_initialized", False):
+            self.check()
 
     def __contains__(self, name):
         return hasattr(self, name)
@@ -153,25 +163,8 @@ class DjangoKitSettings:
         if not self.admin_prefix:
             raise ImproperlyConfigured("Admin prefix must be set.")
 
-        # Mount point & prefixes:
-        # - can be an empty string
-        # - must not be a single slash
-        # - must not start with a slash
-        # - must end with a slash
-        for val, label in (
-            (self.prefix, "Mount point"),
-            (self.admin_prefix, "Admin prefix"),
-        ):
-            if not val:
-                continue
-            if val == "/":
-                raise ImproperlyConfigured(
-                    f"{label} is not valid (use an empty string instead of a slash)."
-                )
-            if val.startswith("/"):
-                raise ImproperlyConfigured(f"{label} must not start with a slash.")
-            if not val.endswith("/"):
-                raise ImproperlyConfigured(f"{label} must end with a slash.")
+        for name, label in PREFIX_FIELDS:
+            check_prefix(getattr(self, name), label)
 
     def as_dict(self) -> Dict[str, Any]:
         """Return a dict with *all* DjangoKit settings.
@@ -179,5 +172,55 @@ class DjangoKitSettings:
         This will include defaults plus any values set in the project's
         Django settings module in the `DJANGOKIT` dict.
 
+        .. note::
+            This is a shallow copy. Values are *not* copied, so mutable
+            values such as lists and dicts are shared with the settings.
+
         """
-        return asdict(self)
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+# Names and labels of settings that are checked with check_prefix().
+PREFIX_FIELDS = (
+    ("prefix", "Mount point"),
+    ("admin_prefix", "Admin prefix"),
+)
+
+
+@lru_cache(maxsize=None)
+def check_prefix(val: str, label: str) -> None:
+    """Check mount point or prefix.
+
+    Mount point & prefixes:
+
+    - can be an empty string
+    - must not be a single slash
+    - must not start with a slash
+    - must end with a slash
+
+    """
+    if not val:
+        return
+    if val == "/":
+        raise ImproperlyConfigured(
+            f"{label} is not valid (use an empty string instead of a slash)."
+        )
+    if val.startswith("/"):
+        raise ImproperlyConfigured(f"{label} must not start with a slash.")
+    if not val.endswith("/"):
+        raise ImproperlyConfigured(f"{label} must end with a slash.")
+
+
+@lru_cache(maxsize=None)
+def get_package_dir(package: str) -> Path:
+    """Get file system path of DjangoKit app package."""
+    module = import_module(package)
+    paths = module.__path__
+    if len(paths) > 1:
+        raise ImproperlyConfigured(
+            f"DjangoKit app package {package} appears to be a "
+            "namespace package because it resolves to multiple "
+            "file system paths. You might need to add an "
+            "__init__.py to the package."
+        )
+    return Path(paths[0])
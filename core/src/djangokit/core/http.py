@@ -4,6 +4,15 @@ from django.http import JsonResponse as DjangoJsonResponse
 
 from .serializers import JsonEncoder
 
+_JSON_TYPES = frozenset((dict, list, tuple, str, int, float, bool, type(None)))
+
+_REQUEST_PROPERTIES = frozenset(
+    name
+    for cls in HttpRequest.__mro__
+    for name, val in vars(cls).items()
+    if isinstance(val, property)
+)
+
 
 def make_request(**attrs):
     """Make a request object with the specified attributes."""
@@ -17,14 +26,17 @@ def make_request(**attrs):
 
     request = HttpRequest()
 
-    for name, val in attrs.items():
-        setattr(request, name, val)
+    # NOTE: Properties like `encoding` have to go through setattr so
+    #       their setters run.
+    for name in _REQUEST_PROPERTIES.intersection(attrs):
+        setattr(request, name, attrs.pop(name))
 
+    request.__dict__.update(attrs)
     return request
 
 
 class JsonResponse(DjangoJsonResponse):
     def __init__(self, data, encoder=JsonEncoder, safe=True, **kwargs):
-        if safe and isinstance(data, models.Model):
+        if safe and type(data) not in _JSON_TYPES and isinstance(data, models.Model):
             safe = False
         super().__init__(data, encoder=encoder, safe=safe, **kwargs)
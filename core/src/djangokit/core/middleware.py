@@ -1,10 +1,37 @@
 import json
 import posixpath
+from typing import Any
 
 from django.conf import settings
 from django.core.exceptions import BadRequest
 from django.http import HttpRequest
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def json_loads(body: bytes) -> Any:
+    """Parse JSON request body.
+
+    When the optional orjson package is installed, it's used to parse
+    the body. Bodies orjson rejects but the standard library accepts,
+    such as those with a UTF-8 BOM, UTF-16 bodies, `NaN`, and numbers
+    out of float range, are parsed with `json.loads` instead.
+
+    .. note::
+        orjson parses integers that don't fit in 64 bits as floats, so
+        such values lose precision when orjson is installed.
+
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(body)
+
 
 def djangokit_middleware(get_response):
     """DjangoKit middleware.
@@ -30,42 +57,28 @@ def djangokit_middleware(get_response):
     - If the request is a modifying type, adds a `data` attribute to the
       request. The data will be extracted from `request.POST` or
       `request.body` (as JSON) depending on the `Content-Type` header.
+      See :func:`json_loads` for how JSON bodies are parsed.
 
     """
-    dk_settings = settings.DJANGOKIT
-    intercept_extensions = dk_settings.intercept_extensions
-    methods_with_data = ("PATCH", "POST", "PUT")
+    intercept_extensions = settings.DJANGOKIT.intercept_extensions
+    methods_with_data = frozenset(("PATCH", "POST", "PUT"))
+    form_content_types = frozenset(
+        ("application/x-www-form-urlencoded", "multipart/form-data")
+    )
 
     def middleware(request: HttpRequest):
         method = request.method
-        meta = request.META
-        path = request.path
-
-        if intercept_extensions:
-            _, ext = posixpath.splitext(path)
-
-        if intercept_extensions and ext in intercept_extensions:
-            j = -len(ext)
-            request.path = path[:j]
-            request.path_info = request.path_info[:j]
-            meta["HTTP_ACCEPT"] = intercept_extensions[ext]
-            meta["PATH_INFO"] = request.META["PATH_INFO"][:j]
-
-        accept = meta.get("HTTP_ACCEPT", "*/*")
-        request.prefers_json = accept == "application/json"
+        request.prefers_json = request.META.get("HTTP_ACCEPT") == "application/json"
 
         # Add data attribute when appropriate
         if method in methods_with_data:
             content_type = request.content_type
-            if content_type in (
-                "application/x-www-form-urlencoded",
-                "multipart/form-data",
-            ):
+            if content_type in form_content_types:
                 request.data = request.POST
                 request.files = request.FILES
             elif content_type == "application/json":
                 try:
-                    request.data = json.loads(request.body)
+                    request.data = json_loads(request.body)
                 except ValueError:
                     raise BadRequest("Could not parse JSON from request body.")
             else:
@@ -78,4 +91,24 @@ def djangokit_middleware(get_response):
         response = get_response(request)
         return response
 
-    return middleware
+    if not intercept_extensions:
+        return middleware
+
+    ext_suffixes = tuple(intercept_extensions)
+
+    def intercepting_middleware(request: HttpRequest):
+        path = request.path
+
+        if path.endswith(ext_suffixes):
+            _, ext = posixpath.splitext(path)
+            if ext in intercept_extensions:
+                meta = request.META
+                j = -len(ext)
+                request.path = path[:j]
+                request.path_info = request.path_info[:j]
+                meta["HTTP_ACCEPT"] = intercept_extensions[ext]
+                meta["PATH_INFO"] = meta["PATH_INFO"][:j]
+
+        return middleware(request)
+
+    return intercepting_middleware
@@ -1,36 +1,59 @@
 import dataclasses
-import posixpath
+import os
+import sys
 from functools import cached_property, lru_cache
 from importlib import import_module
-from inspect import signature
 from pathlib import Path
 from types import ModuleType
-from typing import Any, Callable, Dict, List, Literal, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from django import urls as urlconf
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.urls.converters import StringConverter
 
 from .exceptions import RouteError
 
 
-class ExtConverter:
+class ExtConverter(StringConverter):
     regex = r"[a-z]+"
 
-    def to_python(self, value):
-        return value
-
-    def to_url(self, value):
-        return value
-
 
 urlconf.register_converter(ExtConverter, "__ext__")
 
 
 def discover_routes() -> list:
-    """Find file-based routes and return URLs for them."""
+    """Find file-based routes and return URLs for them.
+
+    The URLs are computed once and cached along with the route tree;
+    call `make_route_dir_tree.cache_clear()` to rediscover them. A new
+    list is returned on each call so callers are free to modify it.
+
+    """
+    return list(_discover_routes())
+
+
+@lru_cache(maxsize=None)
+def _discover_routes() -> tuple:
     dk_settings = settings.DJANGOKIT
     view_class = dk_settings.route_view_class
+    view_options = {
+        "cache_time": dk_settings.cache_time,
+        "private": dk_settings.private,
+        "vary_on": dk_settings.vary_on,
+        "cache_control": dk_settings.cache_control,
+    }
+    make_path = urlconf.path
 
     urls = []
     tree = make_route_dir_tree()
@@ -41,18 +64,12 @@ def discover_routes() -> list:
         added_patterns = set()
 
         pattern = node.url_pattern
-        view = view_class.as_view_from_node(
-            node,
-            cache_time=dk_settings.cache_time,
-            private=dk_settings.private,
-            vary_on=dk_settings.vary_on,
-            cache_control=dk_settings.cache_control,
-        )
+        view = view_class.as_view_from_node(node, **view_options)
         handlers = view.view_initkwargs["handlers"]
 
         if node.page_module:
             added_patterns.add(pattern)
-            urls.append(urlconf.path(pattern, view, {"__subpath__": ""}))
+            urls.append(make_path(pattern, view, {"__subpath__": ""}))
 
         for method, method_handlers in handlers.items():
             for subpath, handler in method_handlers.items():
@@ -63,56 +80,64 @@ def discover_routes() -> list:
                 elif pattern == "":
                     subpattern = subpath
                 else:
-                    subpattern = f"{pattern}/{subpath}"
+                    subpattern = sys.intern(f"{pattern}/{subpath}")
 
                 view_kwargs = {"__subpath__": subpath}
 
                 if subpattern not in added_patterns:
                     added_patterns.add(subpattern)
-                    urls.append(urlconf.path(subpattern, view, view_kwargs))
+                    urls.append(make_path(subpattern, view, view_kwargs))
 
                 ext_subpattern = f"{subpattern}.<__ext__:__ext__>"
                 if ext_subpattern not in added_patterns:
                     added_patterns.add(ext_subpattern)
-                    sig = signature(handler.impl)
-                    if any(name == "__ext__" for name in sig.parameters):
-                        urls.append(urlconf.path(ext_subpattern, view, view_kwargs))
+                    if handler.accepts_ext:
+                        ext_subpattern = sys.intern(ext_subpattern)
+                        urls.append(make_path(ext_subpattern, view, view_kwargs))
 
-    return urls
+    return tuple(urls)
 
 
-@lru_cache(maxsize=None)
 def make_route_dir_tree(path=None, parent=None) -> "RouteNode":
     """Make a tree of route directory info.
 
     Returns the root node of the tree.
 
+    Nodes are cached by path. Call `make_route_dir_tree.cache_clear()`
+    to force the tree to be rebuilt; this also clears the URLs cached by
+    `discover_routes()`.
+
     """
     if path is None:
         path = settings.DJANGOKIT.routes_dir
 
+    key = os.fspath(path)
+    node = _tree_cache.get(key)
+    if node is not None and node.parent is parent:
+        return node
+
     directories = []
-    file_names = []
-
-    for entry in path.iterdir():
-        name = entry.name
-        if entry.is_file():
-            file_names.append(name)
-        elif entry.is_dir() and name != "__pycache__":
-            directories.append(entry)
-
-    def get_tsx_or_jsx_module(stem: str) -> Optional[str]:
-        candidates = [f"{stem}.tsx", f"{stem}.jsx"]
-        for candidate in candidates:
-            if candidate in file_names:
-                return candidate
-        return None
-
-    layout_module = get_tsx_or_jsx_module("layout")
-    nested_layout_module = get_tsx_or_jsx_module("nested-layout")
-    page_module = get_tsx_or_jsx_module("page")
-    error_module = get_tsx_or_jsx_module("error")
-    handler_module_name = "handlers.py" if "handlers.py" in file_names else None
+    modules: Dict[str, str] = {}
+    handler_module_name = None
+
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir():
+                if name != "__pycache__":
+                    directories.append(Path(entry.path))
+            elif entry.is_file():
+                if name.endswith((".tsx", ".jsx")):
+                    stem = name[:-4]
+                    if stem not in modules or name.endswith(".tsx"):
+                        modules[stem] = name
+                elif name == "handlers.py":
+                    handler_module_name = name
+
+    layout_module = modules.get("layout")
+    nested_layout_module = modules.get("nested-layout")
+    page_module = modules.get("page")
+    error_module = modules.get("error")
 
     node = RouteNode(
         parent,
@@ -131,20 +156,77 @@ def make_route_dir_tree(path=None, parent=None) -> "RouteNode":
             "route."
         )
 
-    directories = sorted(
-        directories,
-        key=lambda d: (
-            1 if d.name == "catchall" else 0,
-            1 if d.name.startswith("_") else 0,
-            -len(d.name),
-            d.name,
-        ),
-    )
-
+    directories = sorted(directories, key=lambda d: _route_dir_sort_key(d.name))
     node.children = [make_route_dir_tree(directory, node) for directory in directories]
+    _tree_cache[key] = node
     return node
 
 
+_tree_cache: Dict[str, "RouteNode"] = {}
+
+
+def _clear_route_caches():
+    _tree_cache.clear()
+    _discover_routes.cache_clear()
+
+
+make_route_dir_tree.cache_clear = _clear_route_caches  # type: ignore[attr-defined]
+
+
+# Path converters for well-known param names
+_URL_CONVERTERS = {"id": "int:", "slug": "slug:", "uuid": "uuid:"}
+
+
+@lru_cache(maxsize=None)
+def url_segment(part: str) -> str:
+    """Convert route directory name to Django URL pattern segment.
+
+    A leading underscore indicates a param: `_slug` => `<slug:slug>`.
+    Other underscores are converted to dashes: `about_us` => `about-us`.
+
+    """
+    if part.startswith("_"):
+        name = part[1:]
+        return f"<{_URL_CONVERTERS.get(name, '')}{name}>"
+    return part.replace("_", "-")
+
+
+def _route_dir_sort_key(name: str) -> Tuple[int, int, int, str]:
+    # Static routes sort before param routes, which sort before the
+    # catchall route. Within those groups, longer names sort first.
+    return (
+        1 if name == "catchall" else 0,
+        1 if name.startswith("_") else 0,
+        -len(name),
+        name,
+    )
+
+
+@lru_cache(maxsize=None)
+def route_segment(part: str) -> str:
+    """Convert route directory name to React Router path segment.
+
+    A leading underscore indicates a param: `_user_id` => `:userId`.
+    Other underscores are converted to dashes: `about_us` => `about-us`.
+
+    """
+    if part.startswith("_"):
+        first, *rest = part[1:].split("_")
+        return f":{first}{''.join(p.capitalize() for p in rest)}"
+    return part.replace("_", "-")
+
+
+class Element(NamedTuple):
+    """Reference to a route component in the JS routes array.
+
+    Serialized as a JSX element like `<Page_docs />`.
+
+    """
+
+    type: Literal["Layout", "NestedLayout", "Error", "Page"]
+    id: str
+
+
 @dataclasses.dataclass
 class RouteNode:
     """A node in the route tree containing info about a route."""
@@ -172,7 +254,18 @@ class RouteNode:
     children: List["RouteNode"] = dataclasses.field(default_factory=list)
 
     def __post_init__(self):
-        if self.id == "catchall" and self.children:
+        parent = self.parent
+        self.is_root = parent is None
+        self.root = self if parent is None else parent.root
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.rel_path = self._make_rel_path()
+        self.id = self._make_id()
+        self.is_catchall = self.id == "catchall"
+        self.package_name = self._make_package_name()
+        self.url_pattern = self._make_url_pattern()
+        self.route_pattern = self._make_route_pattern()
+
+        if self.is_catchall and self.children:
             raise ImproperlyConfigured("A catchall route cannot have children")
 
     def __hash__(self):
@@ -180,60 +273,36 @@ class RouteNode:
 
     # Tree -------------------------------------------------------------
 
-    @cached_property
-    def root(self):
-        current = self
-        while True:
-            parent = current.parent
-            if parent is None:
-                return current
-            current = parent
-
-    @cached_property
-    def is_root(self):
-        return self.parent is None
-
-    @cached_property
-    def depth(self):
-        return 0 if self.is_root else len(self.rel_path.parts)
-
     def traverse(self, visit: Callable[["RouteNode"], None], node=None):
         """Traverse tree starting from specified node."""
-        if node is None:
-            node = self
-        if visit is None:
-            visit = self.default_visitor
-        visit(node)
-        for child in node.children:
-            self.traverse(visit, child)
+        for node_ in self if node is None else node:
+            visit(node_)
 
     def __iter__(self):
-        yield self
-        for child in self.children:
-            yield from child
+        # Children are pushed in reverse so nodes are yielded in pre-order.
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
 
     # Route directory info ---------------------------------------------
 
-    @cached_property
-    def id(self) -> str:
-        return "$root" if self.is_root else "_".join(self.rel_path.parts)
-
-    @cached_property
-    def is_catchall(self) -> bool:
-        return self.id == "catchall"
+    def _make_id(self) -> str:
+        return "$root" if self.is_root else sys.intern("_".join(self.rel_path.parts))
 
-    @cached_property
-    def rel_path(self) -> Path:
+    def _make_rel_path(self) -> Path:
         """Relative path from root."""
-        return self.path.relative_to(self.root.path)
+        parent = self.parent
+        if parent is None:
+            return Path()
+        return parent.rel_path / self.path.name
 
-    @cached_property
-    def package_name(self) -> str:
-        routes_package = settings.DJANGOKIT.routes_package
-        if self.is_root:
-            return routes_package
-        package_name = ".".join(self.rel_path.parts)
-        return f"{routes_package}.{package_name}"
+    def _make_package_name(self) -> str:
+        parent = self.parent
+        if parent is None:
+            return settings.DJANGOKIT.routes_package
+        return f"{parent.package_name}.{self.path.name}"
 
     @cached_property
     def handler_module(self) -> Optional[ModuleType]:
@@ -243,52 +312,28 @@ class RouteNode:
         qual_name = f"{self.package_name}.{name}"
         return import_module(qual_name)
 
-    @cached_property
-    def url_pattern(self) -> str:
+    def _make_url_pattern(self) -> str:
         """Convert route path to Django URL pattern."""
-        if self.is_root:
+        parent = self.parent
+        if parent is None:
             return ""
-        segments = []
-        for part in self.rel_path.parts:
-            if part.startswith("_"):
-                name = part[1:]
-                if name == "id":
-                    segment = f"<int:{name}>"
-                elif name == "slug":
-                    segment = f"<slug:{name}>"
-                elif name == "uuid":
-                    segment = f"<uuid:{name}>"
-                else:
-                    segment = f"<{name}>"
-                segments.append(segment)
-            else:
-                part = part.replace("_", "-")
-                segments.append(part)
         if self.is_catchall:
-            segments[-1] = "<path:path>"
-        pattern = "/".join(segments)
-        return pattern
+            segment = "<path:path>"
+        else:
+            segment = url_segment(self.path.name)
+        base = parent.url_pattern
+        return sys.intern(f"{base}/{segment}" if base else segment)
 
-    @cached_property
-    def route_pattern(self) -> str:
+    def _make_route_pattern(self) -> str:
         """Convert route path to React Router URL pattern."""
-        if self is self.root:
+        parent = self.parent
+        if parent is None:
             return "/"
-        segments = []
-        for part in self.rel_path.parts:
-            if part.startswith("_"):
-                name = part[1:]
-                name_parts = name.split("_")
-                name_parts = [name_parts[0]] + [p.capitalize() for p in name_parts[1:]]
-                segment = f":{''.join(name_parts)}"
-            else:
-                segment = part.replace("_", "-")
-            segments.append(segment)
         if self.is_catchall:
-            segments[-1] = "*"
-        pattern = "/".join(segments)
-        pattern = f"/{pattern}"
-        return pattern
+            return "/*"
+        segment = route_segment(self.path.name)
+        base = parent.route_pattern
+        return sys.intern(f"{base}{segment}" if base == "/" else f"{base}/{segment}")
 
     @cached_property
     def layout_for_nested_layout(self) -> Optional["RouteNode"]:
@@ -326,10 +371,12 @@ class RouteNode:
         else:
             raise ValueError(kind)
         assert layout
-        pattern = posixpath.relpath(self.route_pattern, layout.route_pattern)
-        if pattern == ".":
-            pattern = ""
-        return pattern
+        # NOTE: A node's route pattern always extends its layout's route
+        #       pattern, so the relative pattern is just what follows it.
+        base = layout.route_pattern
+        pattern = self.route_pattern
+        assert pattern.startswith(base), f"{pattern} not under {base}"
+        return pattern[len(base) :].lstrip("/")
 
     @cached_property
     def route_pattern_for_nested_layout(self) -> str:
@@ -344,20 +391,32 @@ class RouteNode:
     def js_imports(self, routes_path: str, join=True) -> Union[List[str], str]:
         """Get JS imports for node including imports for child nodes."""
         imports = []
+        routes_path = routes_path.rstrip("/")
 
-        def imp(node_, component, segment):
-            path = posixpath.join(routes_path, *node_.rel_path.parts, segment)
-            return f'import {{ default as {component}_{node_.id} }} from "{path}";'
+        def imp(component, id_, base, segment):
+            return f'import {{ default as {component}_{id_} }} from "{base}/{segment}";'
 
         for node in self:
+            if not (
+                node.layout_module
+                or node.nested_layout_module
+                or node.error_module
+                or node.page_module
+            ):
+                continue
+
+            # The import base path is computed once per node.
+            id_ = node.id
+            base = "/".join((routes_path, *node.rel_path.parts))
+
             if node.layout_module:
-                imports.append(imp(node, "Layout", "layout"))
+                imports.append(imp("Layout", id_, base, "layout"))
             elif node.nested_layout_module:
-                imports.append(imp(node, "NestedLayout", "nested-layout"))
+                imports.append(imp("NestedLayout", id_, base, "nested-layout"))
             if node.error_module:
-                imports.append(imp(node, "Error", "error"))
+                imports.append(imp("Error", id_, base, "error"))
             if node.page_module:
-                imports.append(imp(node, "Page", "page"))
+                imports.append(imp("Page", id_, base, "page"))
 
         return "\n".join(imports) if join else imports
 
@@ -366,11 +425,6 @@ class RouteNode:
         top = []
         layouts: Dict[Path, Dict[str, Any]] = {}
 
-        @dataclasses.dataclass
-        class Element:
-            type: Literal["Layout", "NestedLayout", "Error", "Page"]
-            id: str
-
         for node in self:
             if node.layout_module or node.nested_layout_module:
                 if node.nested_layout_module:
@@ -416,27 +470,46 @@ class RouteNode:
         if not serialize:
             return top
 
-        def serializer(obj):
-            if isinstance(obj, dict):
-                entries = [f"{k}: {serializer(v)}" for k, v in obj.items()]
-                entries = ",".join(entries)
-                return "".join(("{", entries, "}"))
+        # Values and literal tokens are pushed in reverse so they're
+        # emitted in order as they're popped.
+        buf: List[str] = []
+        append = buf.append
+        stack: List[Tuple[bool, Any]] = [(False, top)]
+        push = stack.append
+        pop = stack.pop
+
+        while stack:
+            is_token, obj = pop()
+            if is_token:
+                append(obj)
+            elif isinstance(obj, dict):
+                append("{")
+                push((True, "}"))
+                items = list(obj.items())
+                for i in range(len(items) - 1, -1, -1):
+                    k, v = items[i]
+                    push((False, v))
+                    push((True, f",{k}: " if i else f"{k}: "))
             elif isinstance(obj, list):
-                items = [serializer(item) for item in obj]
-                items = ",".join(items)
-                return f"[{items}]"
+                append("[")
+                push((True, "]"))
+                for i in range(len(obj) - 1, -1, -1):
+                    push((False, obj[i]))
+                    if i:
+                        push((True, ","))
             elif isinstance(obj, str):
-                return f'"{obj}"'
+                buf.extend(('"', obj, '"'))
             elif isinstance(obj, Element):
-                return f"<{obj.type}_{obj.id} />"
-            type_ = obj.__class__.__name__
-            raise TypeError(f"Unexpected object type: {type_}")
+                buf.extend(("<", obj.type, "_", obj.id, " />"))
+            else:
+                type_ = obj.__class__.__name__
+                raise TypeError(f"Unexpected object type: {type_}")
 
-        return serializer(top)
+        return "".join(buf)
 
     def __str__(self):
         indent = " " * (self.depth * 4)
-        path = self.path.relative_to(self.parent.path) if self.parent else "/"
+        path = self.path.name if self.parent else "/"
 
         has = ", ".join(
             item
@@ -445,7 +518,7 @@ class RouteNode:
                 "nested layout" if self.nested_layout_module else None,
                 "page" if self.page_module else None,
                 "error" if self.error_module else None,
-                "handler module" if self.handler_module else None,
+                "handler module" if self.handler_module_name else None,
             )
             if item is not None
         )
@@ -1,5 +1,7 @@
 import logging
 from dataclasses import dataclass
+from functools import cached_property
+from inspect import signature
 from typing import Callable, Optional, Sequence
 
 from django.core.exceptions import ImproperlyConfigured
@@ -84,6 +86,19 @@ class Handler:
     def __post_init__(self):
         self.check()
 
+        cache_control = self.cache_control or {}
+        self.private_cache_control = {
+            **{n: v for n, v in cache_control.items() if n != "public"},
+            "private": True,
+        }
+        if self.cache_time is None:
+            self.public_cache_control = cache_control
+        else:
+            self.public_cache_control = {
+                **{n: v for n, v in cache_control.items() if n != "private"},
+                "public": True,
+            }
+
     def check(self):
         if self.is_loader and self.method != "get":
             raise ImproperlyConfigured(f"Cannot use {self.method} handler as a loader.")
@@ -104,6 +119,11 @@ class Handler:
                 #      unexpected results.
                 raise ImproperlyConfigured("Cannot use private with cache_time.")
 
+    @cached_property
+    def accepts_ext(self) -> bool:
+        """Does the handler implementation accept an `__ext__` arg?"""
+        return "__ext__" in signature(self.impl).parameters
+
     def set_defaults(self, **defaults):
         """Set defaults for attributes that aren't set."""
         for n, v in defaults.items():
@@ -210,12 +230,10 @@ class Handler:
         if request.method not in ("GET", "HEAD"):
             return
 
-        if self.cache_control:
-            patch_cache_control(response, **self.cache_control)
-
         if self.private or request.user.is_authenticated:
-            patch_cache_control(response, private=True)
-        elif self.cache_time is not None:
-            patch_cache_control(response, public=True)
-            if self.vary_on:
+            patch_cache_control(response, **self.private_cache_control)
+        else:
+            if self.public_cache_control:
+                patch_cache_control(response, **self.public_cache_control)
+            if self.cache_time is not None and self.vary_on:
                 patch_vary_headers(response, self.vary_on)
@@ -1,9 +1,14 @@
 import os
 import pathlib
+import tempfile
+from unittest import mock
 
 from django.conf import settings
 from django.test import SimpleTestCase
 
+from djangokit.core import conf
+from djangokit.core.conf import getenv, load_settings, load_toml
+
 
 class TestConf(SimpleTestCase):
     def test_DJANGO_SETTINGS_FILE(self):
@@ -38,3 +43,45 @@ class TestConf(SimpleTestCase):
     def test_get_unknown_setting(self):
         with self.assertRaises(AttributeError):
             settings.DJANGOKIT.unknown
+
+    def test_getenv_converts_toml_values(self):
+        env = {"INT": "1", "BOOL": "true", "LIST": '["a", "b"]', "STR": '"x"'}
+        with mock.patch.dict(os.environ, env):
+            self.assertEqual(getenv("INT"), 1)
+            self.assertIs(getenv("BOOL"), True)
+            self.assertEqual(getenv("LIST"), ["a", "b"])
+            self.assertEqual(getenv("STR"), "x")
+
+    def test_getenv_returns_non_toml_values_as_is(self):
+        env = {"URL": "postgres://localhost/db", "EMPTY": "", "WORD": "true-ish"}
+        with mock.patch.dict(os.environ, env):
+            self.assertEqual(getenv("URL"), "postgres://localhost/db")
+            self.assertEqual(getenv("EMPTY"), "")
+            self.assertEqual(getenv("WORD"), "true-ish")
+
+    def test_load_toml_returns_copy_of_cached_settings(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = pathlib.Path(temp_dir) / "settings.toml"
+            path.write_text("[djangokit]\ncli = {}\n")
+            loaded = load_toml(path)
+            loaded["djangokit"].pop("cli")
+            self.assertEqual(load_toml(path), {"djangokit": {"cli": {}}})
+
+    def test_load_toml_replaces_cached_settings_when_file_changes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = pathlib.Path(temp_dir) / "settings.toml"
+            path.write_text("a = 1\n")
+            os.utime(path, ns=(0, 1_000_000_000))
+            self.assertEqual(load_toml(path), {"a": 1})
+            path.write_text("a = 2\n")
+            os.utime(path, ns=(0, 2_000_000_000))
+            self.assertEqual(load_toml(path), {"a": 2})
+            self.assertEqual(conf._toml_cache[str(path)], (2_000_000_000, {"a": 2}))
+
+    def test_load_settings_skips_missing_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = pathlib.Path(temp_dir) / "settings.toml"
+            path.write_text("a = 1\n")
+            self.assertEqual(load_settings(path=path), {"a": 1})
+            with self.assertRaises(FileNotFoundError):
+                load_toml(path.parent / "settings.public.toml")
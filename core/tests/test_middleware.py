@@ -1,5 +1,9 @@
+import math
+
 import pytest
+from django.core.exceptions import BadRequest
 
+from djangokit.core import middleware as middleware_module
 from djangokit.core.http import make_request
 from djangokit.core.middleware import djangokit_middleware
 
@@ -26,3 +30,96 @@ def test_json_ext_via_client(client):
     assert response.headers["Content-Type"] == "application/json"
     data = response.json()
     assert data == {"slug": "test"}
+
+
+def test_unknown_ext_is_not_intercepted(middleware):
+    path = "/docs/test.xml"
+    request = make_request(path=path)
+    result = middleware(request)
+    assert result.path == path
+    assert result.META["PATH_INFO"] == path
+    assert result.prefers_json is False
+
+
+def test_no_intercept_extensions(monkeypatch, settings):
+    monkeypatch.setattr(settings.DJANGOKIT, "intercept_extensions", None)
+    middleware = djangokit_middleware(lambda req: req)
+    path = "/docs/test.json"
+    request = make_request(path=path)
+    result = middleware(request)
+    assert result.path == path
+    assert result.META["PATH_INFO"] == path
+
+
+def test_json_body_uses_orjson():
+    pytest.importorskip("orjson")
+    assert middleware_module.orjson is not None
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_parser(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(middleware_module, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "body,expected",
+    [
+        (b'{"a": [1, 2]}', {"a": [1, 2]}),
+        (b'\xef\xbb\xbf{"a": 1}', {"a": 1}),
+        ('{"a": 1}'.encode("utf-16"), {"a": 1}),
+        (b"1e400", float("inf")),
+    ],
+)
+def test_json_body_parsing(json_parser, middleware, body, expected):
+    request = make_request(method="POST", content_type="application/json", _body=body)
+    result = middleware(request)
+    assert result.data == expected
+
+
+def test_json_body_nan(json_parser, middleware):
+    request = make_request(method="POST", content_type="application/json", _body=b"NaN")
+    result = middleware(request)
+    assert math.isnan(result.data)
+
+
+def test_json_body_big_int(json_parser, middleware):
+    body = str(2**64).encode()
+    request = make_request(method="POST", content_type="application/json", _body=body)
+    result = middleware(request)
+    if json_parser == "orjson":
+        assert result.data == float(2**64)
+    else:
+        assert result.data == 2**64
+
+
+def test_invalid_json_body(json_parser, middleware):
+    request = make_request(
+        method="POST",
+        content_type="application/json",
+        _body=b"{",
+    )
+    with pytest.raises(BadRequest):
+        middleware(request)
+
+
+@pytest.mark.parametrize("path", ["/docs/.json", "/.json"])
+def test_dot_file_name_is_not_intercepted(middleware, path):
+    request = make_request(path=path)
+    result = middleware(request)
+    assert result.path == path
+    assert result.META["PATH_INFO"] == path
+    assert result.prefers_json is False
+
+
+def test_overlapping_extensions_use_actual_extension(monkeypatch, settings):
+    extensions = {".min.json": "text/plain", ".json": "application/json"}
+    monkeypatch.setattr(settings.DJANGOKIT, "intercept_extensions", extensions)
+    middleware = djangokit_middleware(lambda req: req)
+    request = make_request(path="/docs/test.min.json")
+    result = middleware(request)
+    assert result.path == "/docs/test.min"
+    assert result.headers["Accept"] == "application/json"
@@ -1,6 +1,13 @@
+from pathlib import Path
+
 import pytest
 
-from djangokit.core.routes import RouteNode, make_route_dir_tree
+from djangokit.core.routes import (
+    RouteNode,
+    discover_routes,
+    make_route_dir_tree,
+    url_segment,
+)
 
 
 @pytest.fixture
@@ -35,3 +42,81 @@ def test_iter(tree, expected_node_ids):
 def test_js_routes(tree):
     routes = tree.js_routes(serialize=False)
     assert len(routes) == 2
+
+
+def test_route_pattern_camel_cases_param_name():
+    root = RouteNode(None, Path("/routes"), None, None, None, None, None)
+    node = RouteNode(root, Path("/routes/_user_id"), None, None, None, None, None)
+    assert node.route_pattern == "/:userId"
+
+
+def test_discover_routes_returns_new_list():
+    urls = discover_routes()
+    assert urls
+    urls.clear()
+    assert discover_routes()
+
+
+@pytest.mark.parametrize(
+    "part,expected",
+    [
+        ("_id", "<int:id>"),
+        ("_slug", "<slug:slug>"),
+        ("_uuid", "<uuid:uuid>"),
+        ("_name", "<name>"),
+        ("about_us", "about-us"),
+    ],
+)
+def test_url_segment(part, expected):
+    assert url_segment(part) == expected
+
+
+def test_make_route_dir_tree_is_cached():
+    tree = make_route_dir_tree()
+    assert make_route_dir_tree() is tree
+    make_route_dir_tree.cache_clear()
+    new_tree = make_route_dir_tree()
+    assert new_tree is not tree
+    assert [n.id for n in new_tree] == [n.id for n in tree]
+
+
+def test_cache_clear_also_clears_discovered_routes():
+    urls = discover_routes()
+    make_route_dir_tree.cache_clear()
+    new_urls = discover_routes()
+    assert [str(u.pattern) for u in new_urls] == [str(u.pattern) for u in urls]
+    assert new_urls[0].callback is not urls[0].callback
+
+
+def test_make_route_dir_tree_prefers_tsx(tmp_path):
+    for name in ("page.jsx", "page.tsx", "layout.jsx", "handlers.py"):
+        (tmp_path / name).touch()
+    tree = make_route_dir_tree(tmp_path)
+    assert tree.page_module == "page.tsx"
+    assert tree.layout_module == "layout.jsx"
+    assert tree.handler_module_name == "handlers.py"
+
+
+def test_make_route_dir_tree_includes_dot_dirs(tmp_path):
+    (tmp_path / ".well-known").mkdir()
+    (tmp_path / ".well-known" / "handlers.py").touch()
+    (tmp_path / "__pycache__").mkdir()
+    tree = make_route_dir_tree(tmp_path)
+    assert [child.path.name for child in tree.children] == [".well-known"]
+    assert tree.children[0].handler_module_name == "handlers.py"
+
+
+def test_iter_includes_children_added_after_iteration():
+    root = RouteNode(None, Path("/routes"), None, None, None, None, None)
+    assert [n.id for n in root] == ["$root"]
+    about = RouteNode(root, Path("/routes/about"), None, None, None, None, None)
+    root.children.append(about)
+    assert [n.id for n in root] == ["$root", "about"]
+    visited = []
+    root.traverse(lambda n: visited.append(n.id))
+    assert visited == ["$root", "about"]
+
+
+def test_js_imports_normalizes_trailing_slash(tree):
+    assert tree.js_imports("../../routes/") == tree.js_imports("../../routes")
+    assert "//" not in tree.js_imports("../../routes/")
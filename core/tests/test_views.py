@@ -1,5 +1,10 @@
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+
 from djangokit.core import RouteView
+from djangokit.core.http import make_request
 from djangokit.core.routes import make_route_dir_tree
+from djangokit.core.views.handler import Handler
 
 
 def test_view_handlers():
@@ -117,3 +122,20 @@ def test_view_handler_private_caching(client):
     assert "Expires" not in response
     assert response["Cache-Control"] == "private"
     assert "Vary" not in response
+
+
+def test_handler_cache_control():
+    class User:
+        is_authenticated = True
+
+    handler = Handler(lambda request: {}, "get", "", cache_control={"no_cache": True})
+
+    request = make_request(user=AnonymousUser())
+    response = HttpResponse()
+    handler.apply_cache_config(request, response)
+    assert response["Cache-Control"] == "no-cache"
+
+    request = make_request(user=User())
+    response = HttpResponse()
+    handler.apply_cache_config(request, response)
+    assert sorted(response["Cache-Control"].split(", ")) == ["no-cache", "private"]